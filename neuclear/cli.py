@@ -4,7 +4,7 @@ CLI interface for Nuclear Stress Tester
 
 import typer
 import asyncio
-from typing import Optional
+from typing import List, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -78,6 +78,98 @@ def test(
     
     # ... rest of the function
 
+@app.command()
+def matrix(
+    urls: List[str] = typer.Argument(..., help="Target URLs to include in the matrix"),
+    rates: List[int] = typer.Option([1000], "--rate", "-r", help="Requests per second per process (repeatable)"),
+    payload_sizes: List[int] = typer.Option([0], "--payload-size", "-s", help="POST payload size in bytes, 0 for GET (repeatable)"),
+    processes: int = typer.Option(4, "--processes", "-p", help="Number of processes per test"),
+    duration: str = typer.Option("30s", "--duration", "-d", help="Duration of each test (e.g., 30s, 1m)"),
+    warmup: Optional[str] = typer.Option(None, "--warmup", "-w", help="Warm-up excluded from stats (e.g., 10s) or 'auto' for steady-state detection"),
+    mode: str = typer.Option("sequential", "--mode", "-m", help="Scheduler: sequential (warm pool reuse) or isolated (pinned processes)"),
+    parallel: Optional[int] = typer.Option(None, "--parallel", help="Concurrent tests in isolated mode (default: one per config)"),
+    target_pid: Optional[int] = typer.Option(None, "--target-pid", help="PID of a local target process to sample alongside the load"),
+    sample_interval: float = typer.Option(1.0, "--sample-interval", help="Seconds between resource samples"),
+    output: str = typer.Option("matrix_report.json", "--output", "-o", help="Consolidated report file"),
+):
+    """
+    Run a matrix of tests (URLs × rates × payload sizes) and compare results
+    """
+    from neuclear.config import Config
+    from neuclear.runner import TestRunner, build_matrix, MATRIX_MODES
+    
+    if mode not in MATRIX_MODES:
+        console.print(f"[red]Error: Mode must be one of: {', '.join(MATRIX_MODES)}[/red]")
+        raise typer.Exit(1)
+    
+    try:
+        base = Config(
+            target_url=urls[0],
+            processes=processes,
+            duration=duration,
+            warmup=warmup,
+            target_pid=target_pid,
+            sample_interval=sample_interval,
+        )
+        configs = build_matrix(base, urls, rates, payload_sizes)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"[bold magenta]💣 Running {len(configs)} tests ({mode})[/bold magenta]")
+    
+    runner = TestRunner(base)
+    results = runner.run_matrix(configs, mode=mode, parallel=parallel)
+    runner.print_comparison(configs, results)
+    runner.save_comparison_report(configs, results, output)
+    console.print(f"[green]Report saved to: {output}[/green]")
+
+@app.command()
+def replay(
+    log_file: str = typer.Argument(..., help="Access log to replay (combined format or JSONL, optionally .gz)"),
+    url: str = typer.Argument(..., help="Base URL to replay recorded paths against"),
+    speed: float = typer.Option(1.0, "--speed", "-x", help="Time scale factor (e.g., 2 or 10 for faster replay)"),
+    processes: int = typer.Option(4, "--processes", "-p", help="Number of sending processes (the log is read once and dealt round-robin)"),
+    max_in_flight: int = typer.Option(1000, "--max-in-flight", help="Outstanding requests per process"),
+    output: str = typer.Option("replay_report.json", "--output", "-o", help="Output report file"),
+):
+    """
+    Replay a recorded access log with its original request timing.
+    
+    Entries logged within the same whole second (combined format) are
+    spread evenly across that second.
+    """
+    from neuclear.config import Config
+    from neuclear.replay import LogReplay
+    
+    try:
+        config = Config(target_url=url, processes=processes)
+        log_replay = LogReplay(config, log_file, speed=speed, max_in_flight=max_in_flight)
+        console.print(f"[bold magenta]💣 Replaying {log_file} against {url} at {speed}x[/bold magenta]")
+        result = log_replay.run()
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    
+    timing = log_replay.timing_report()
+    
+    table = Table(title="Replay Results", header_style="bold cyan")
+    table.add_column("Metric")
+    table.add_column("Value")
+    table.add_row("Total Requests", str(result.total_requests))
+    table.add_row("Success Rate", f"{result.success_rate:.2f}%")
+    table.add_row("Average Latency", f"{result.avg_latency:.2f}ms")
+    table.add_row("p99 Latency", f"{result.p99_latency:.2f}ms")
+    for worker in timing["workers"]:
+        table.add_row(
+            f"Worker {worker['worker']} Lateness",
+            f"p50 {worker['p50_lateness_ms']:.2f}ms / p99 {worker['p99_lateness_ms']:.2f}ms",
+        )
+    console.print(table)
+    
+    log_replay.save_report(output)
+    console.print(f"[green]Report saved to: {output}[/green]")
+
 @app.command()
 def analyze(
     report_file: str = typer.Argument(..., help="Report file to analyze"),
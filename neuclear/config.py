@@ -18,6 +18,16 @@ class Config:
     timeout: int = 30  # Seconds
     headers: Optional[dict] = None
     payload_file: Optional[str] = None
+    payload_size: int = 0  # Bytes; requests are sent as POST when > 0
+    sample_interval: float = 1.0  # Seconds between resource samples
+    target_pid: Optional[int] = None  # Local target process to sample
+    exemplar_top_k: int = 10  # Slowest requests kept per window
+    exemplar_sample_every: int = 1000  # Also keep 1-in-N requests (0 disables)
+    exemplar_window: int = 10  # Seconds
+    request_id_header: str = "X-Request-ID"
+    warmup: Optional[str] = None  # Excluded from stats: "10s", "1m", or "auto"
+    steady_state_windows: int = 5  # One-second windows compared by "auto"
+    steady_state_tolerance: float = 0.2  # Max coefficient of variation
     
     def __post_init__(self):
         # Validate URL format
@@ -34,14 +44,47 @@ class Config:
         if self.timeout <= 0:
             raise ValueError("Timeout must be positive")
         
+        if self.payload_size < 0:
+            raise ValueError("Payload size cannot be negative")
+        
+        if self.sample_interval <= 0:
+            raise ValueError("Sample interval must be positive")
+        
+        if self.exemplar_top_k < 0 or self.exemplar_sample_every < 0:
+            raise ValueError("Exemplar counts cannot be negative")
+        
+        if self.exemplar_window <= 0:
+            raise ValueError("Exemplar window must be positive")
+        
         # Parse duration
         if not re.match(r'^\d+[smh]$', self.duration):
             raise ValueError("Duration must be in format like '30s', '1m', '2h'")
+        
+        if self.warmup is not None and self.warmup != "auto" and not re.match(r'^\d+[smh]$', self.warmup):
+            raise ValueError("Warmup must be 'auto' or in format like '10s', '1m'")
+        
+        if self.steady_state_windows < 2:
+            raise ValueError("Steady state detection needs at least 2 windows")
+        
+        if self.steady_state_tolerance <= 0:
+            raise ValueError("Steady state tolerance must be positive")
     
     @property
     def duration_seconds(self) -> float:
         """Convert duration string to seconds"""
-        match = re.match(r'^(\d+)([smh])$', self.duration)
+        return self._to_seconds(self.duration)
+    
+    @property
+    def warmup_seconds(self) -> Optional[float]:
+        """Fixed warm-up period in seconds, or None when unset or automatic"""
+        if self.warmup is None or self.warmup == "auto":
+            return None
+        return self._to_seconds(self.warmup)
+    
+    @staticmethod
+    def _to_seconds(value: str) -> float:
+        """Convert a duration string like '30s' to seconds"""
+        match = re.match(r'^(\d+)([smh])$', value)
         if not match:
             return 30.0  # Default
         
@@ -73,6 +116,16 @@ class Config:
             "duration_seconds": self.duration_seconds,
             "output_file": self.output_file,
             "timeout": self.timeout,
+            "payload_size": self.payload_size,
+            "sample_interval": self.sample_interval,
+            "target_pid": self.target_pid,
+            "exemplar_top_k": self.exemplar_top_k,
+            "exemplar_sample_every": self.exemplar_sample_every,
+            "exemplar_window": self.exemplar_window,
+            "request_id_header": self.request_id_header,
+            "warmup": self.warmup,
+            "steady_state_windows": self.steady_state_windows,
+            "steady_state_tolerance": self.steady_state_tolerance,
         }
     
     def save(self, filename: str):
@@ -95,6 +148,16 @@ class Config:
             duration=data.get("duration", "30s"),
             output_file=data.get("output_file", "report.json"),
             timeout=data.get("timeout", 30),
+            payload_size=data.get("payload_size", 0),
+            sample_interval=data.get("sample_interval", 1.0),
+            target_pid=data.get("target_pid"),
+            exemplar_top_k=data.get("exemplar_top_k", 10),
+            exemplar_sample_every=data.get("exemplar_sample_every", 1000),
+            exemplar_window=data.get("exemplar_window", 10),
+            request_id_header=data.get("request_id_header", "X-Request-ID"),
+            warmup=data.get("warmup"),
+            steady_state_windows=data.get("steady_state_windows", 5),
+            steady_state_tolerance=data.get("steady_state_tolerance", 0.2),
         )
 
 def create_default_config() -> Config:
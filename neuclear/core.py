@@ -5,13 +5,18 @@ Core stress testing logic
 import asyncio
 import aiohttp
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 import statistics
 from concurrent.futures import ProcessPoolExecutor
 import json
+import random
+import uuid
 from rich import print
 from .config import Config
+from .exemplars import ExemplarRecorder
+from .monitor import ResourceSampler, ResourceSample
+from .warmup import SteadyStateDetector
 
 @dataclass
 class TestResult:
@@ -19,16 +24,64 @@ class TestResult:
     total_requests: int = 0
     successful: int = 0
     failed: int = 0
-    status_codes: Dict[int, int] = None
-    latencies: List[float] = None
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    latencies: List[float] = field(default_factory=list)
     start_time: float = 0
     end_time: float = 0
+    timeline: Dict[int, Dict[str, float]] = field(default_factory=dict)  # Per-second windows
+    resource_samples: List[ResourceSample] = field(default_factory=list)
+    exemplars: Optional[ExemplarRecorder] = None
+    max_latency_samples: Optional[int] = None  # Reservoir-sample latencies beyond this
+    steady_state_start: Optional[float] = None  # Stats count from here when warm-up is excluded
+    warmup: Optional['TestResult'] = None
     
-    def __post_init__(self):
-        if self.status_codes is None:
-            self.status_codes = {}
-        if self.latencies is None:
-            self.latencies = []
+    def record(self, result: Dict[str, Any], window: int):
+        """Record a single request result into the totals and its time window"""
+        self.total_requests += 1
+        if result["success"]:
+            self.successful += 1
+            if self.max_latency_samples is None or len(self.latencies) < self.max_latency_samples:
+                self.latencies.append(result["latency"])
+            else:
+                slot = random.randrange(self.successful)
+                if slot < self.max_latency_samples:
+                    self.latencies[slot] = result["latency"]
+            status_code = result["status_code"]
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        else:
+            self.failed += 1
+        
+        bucket = self.timeline.get(window)
+        if bucket is None:
+            bucket = self.timeline[window] = {"requests": 0, "failed": 0, "latency_sum": 0.0}
+        bucket["requests"] += 1
+        if result["success"]:
+            bucket["latency_sum"] += result["latency"]
+        else:
+            bucket["failed"] += 1
+        
+        if self.exemplars is not None:
+            self.exemplars.offer(result)
+    
+    def merge(self, other: 'TestResult'):
+        """Merge another result (e.g. from a worker) into this one"""
+        self.total_requests += other.total_requests
+        self.successful += other.successful
+        self.failed += other.failed
+        self.latencies.extend(other.latencies)
+        if self.max_latency_samples is not None and len(self.latencies) > self.max_latency_samples:
+            self.latencies = random.sample(self.latencies, self.max_latency_samples)
+        
+        for status_code, count in other.status_codes.items():
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + count
+        
+        self.merge_timeline(other.timeline)
+        
+        if other.exemplars is not None:
+            if self.exemplars is None:
+                self.exemplars = other.exemplars
+            else:
+                self.exemplars.merge(other.exemplars)
     
     @property
     def success_rate(self) -> float:
@@ -44,26 +97,55 @@ class TestResult:
     
     @property
     def p95_latency(self) -> float:
-        if not self.latencies:
-            return 0.0
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
         return statistics.quantiles(self.latencies, n=100)[94]
     
     @property
     def p99_latency(self) -> float:
-        if not self.latencies:
-            return 0.0
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
         return statistics.quantiles(self.latencies, n=100)[98]
     
+    def merge_timeline(self, timeline: Dict[int, Dict[str, float]]):
+        """Merge per-second windows without touching the totals"""
+        for window, other_bucket in timeline.items():
+            bucket = self.timeline.setdefault(
+                window, {"requests": 0, "failed": 0, "latency_sum": 0.0}
+            )
+            for key, value in other_bucket.items():
+                bucket[key] += value
+    
+    @property
+    def measured_duration(self) -> float:
+        """Seconds covered by the stats, excluding any warm-up"""
+        start = self.steady_state_start if self.steady_state_start is not None else self.start_time
+        return self.end_time - start
+    
     @property
     def rps(self) -> float:
-        duration = self.end_time - self.start_time
+        duration = self.measured_duration
         if duration == 0:
             return 0.0
         return self.total_requests / duration
     
-    def save_report(self, filename: str):
-        """Save report to JSON file"""
-        report = {
+    def timeline_report(self) -> List[Dict[str, float]]:
+        """Per-second request windows, on the same axis as resource samples"""
+        rows = []
+        for window in sorted(self.timeline):
+            bucket = self.timeline[window]
+            succeeded = bucket["requests"] - bucket["failed"]
+            rows.append({
+                "t": window,
+                "requests": bucket["requests"],
+                "failed": bucket["failed"],
+                "avg_latency": bucket["latency_sum"] / succeeded if succeeded else 0.0,
+            })
+        return rows
+    
+    def summary(self) -> dict:
+        """Summary statistics, without the detailed report sections"""
+        return {
             "total_requests": self.total_requests,
             "successful": self.successful,
             "failed": self.failed,
@@ -73,8 +155,29 @@ class TestResult:
             "p99_latency": self.p99_latency,
             "requests_per_second": self.rps,
             "status_codes": self.status_codes,
-            "duration_seconds": self.end_time - self.start_time,
+            "duration_seconds": self.measured_duration,
         }
+    
+    def to_dict(self) -> dict:
+        """Convert results to a report dictionary"""
+        report = self.summary()
+        if self.steady_state_start is not None:
+            report["steady_state_start"] = self.steady_state_start - self.start_time
+        if self.warmup is not None:
+            report["warmup"] = self.warmup.summary()
+        
+        report.update({
+            "timeline": self.timeline_report(),
+            "resource_samples": [
+                sample.to_dict(self.start_time) for sample in self.resource_samples
+            ],
+            "exemplars": self.exemplars.to_dict() if self.exemplars is not None else None,
+        })
+        return report
+    
+    def save_report(self, filename: str):
+        """Save report to JSON file"""
+        report = self.to_dict()
         
         with open(filename, 'w') as f:
             json.dump(report, f, indent=2)
@@ -82,33 +185,133 @@ class TestResult:
 class StressTest:
     """Main stress test orchestrator"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config
         self.results = TestResult()
         self.session: Optional[aiohttp.ClientSession] = None
+        # Shared connector lets consecutive tests reuse a warm connection pool
+        self.connector = connector
+        self.payload = b"x" * config.payload_size
+        self.method = "POST" if self.payload else "GET"
+        self.headers = dict(config.headers or {})
+        # Prefix for injected request IDs, so exemplars can be found in server logs
+        self.run_id = uuid.uuid4().hex[:12]
+        self.trace_config = self._phase_trace_config()
+        # Requests starting before this time count as warm-up
+        self.measure_from = 0.0
+        self.warmup_results: List[TestResult] = []
+        self.sampler = ResourceSampler(
+            interval=config.sample_interval,
+            target_pid=config.target_pid,
+        )
+    
+    @staticmethod
+    def _phase_trace_config() -> aiohttp.TraceConfig:
+        """Trace hooks timing connection phases; they only fire on new connections"""
+        trace_config = aiohttp.TraceConfig()
+        
+        def add_phase(name, on_start, on_end):
+            async def start(session, context, params):
+                setattr(context, name, time.time())
+            
+            async def end(session, context, params):
+                phases = context.trace_request_ctx
+                if phases is not None:
+                    phases[name] = (time.time() - getattr(context, name)) * 1000
+            
+            on_start.append(start)
+            on_end.append(end)
+        
+        add_phase("queued", trace_config.on_connection_queued_start, trace_config.on_connection_queued_end)
+        add_phase("dns", trace_config.on_dns_resolvehost_start, trace_config.on_dns_resolvehost_end)
+        add_phase("connect", trace_config.on_connection_create_start, trace_config.on_connection_create_end)
+        
+        return trace_config
     
-    async def make_request(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
-        """Make a single HTTP request"""
+    async def make_request(
+        self,
+        session: aiohttp.ClientSession,
+        request_id: Optional[str] = None,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a single HTTP request, by default to the configured target"""
         start_time = time.time()
+        phases: Dict[str, float] = {}
+        
+        headers = self.headers
+        if request_id is not None:
+            headers = {**headers, self.config.request_id_header: request_id}
+        
+        data = self.payload or None
+        if method is None:
+            method = self.method
+        else:
+            data = None  # Overridden requests carry no payload
+        url = url or self.config.target_url
+        
+        request = session.request(
+            method,
+            url,
+            data=data,
+            headers=headers,
+            trace_request_ctx=phases,
+        )
+        
+        result = {
+            "timestamp": start_time,
+            "request_id": request_id,
+            "method": method,
+            "url": url,
+            "phases": phases,
+        }
         
         try:
-            async with session.get(self.config.target_url) as response:
-                latency = (time.time() - start_time) * 1000  # Convert to ms
+            async with request as response:
+                headers_time = time.time()
+                await response.read()
+                end_time = time.time()
+                phases["ttfb"] = (headers_time - start_time) * 1000  # Convert to ms
+                phases["body"] = (end_time - headers_time) * 1000
                 
-                return {
+                result.update({
                     "success": response.status < 400,
                     "status_code": response.status,
-                    "latency": latency,
+                    "latency": (end_time - start_time) * 1000,
                     "error": None,
-                }
+                })
         except Exception as e:
             latency = (time.time() - start_time) * 1000
-            return {
+            result.update({
                 "success": False,
                 "status_code": 0,
                 "latency": latency,
                 "error": str(e),
-            }
+            })
+        
+        return result
+    
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create a traced client session, on the shared connector if one was given"""
+        if self.connector is not None:
+            return aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=False,
+                trace_configs=[self.trace_config],
+            )
+        
+        connector = aiohttp.TCPConnector(limit=0)  # No connection limit
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self.trace_config])
+    
+    def exemplar_recorder(self, max_sampled: Optional[int] = None) -> ExemplarRecorder:
+        """Create an exemplar recorder anchored at the test start time"""
+        return ExemplarRecorder(
+            start_time=self.results.start_time,
+            top_k=self.config.exemplar_top_k,
+            sample_every=self.config.exemplar_sample_every,
+            window=self.config.exemplar_window,
+            max_sampled=max_sampled,
+        )
     
     async def worker(self, worker_id: int, rate: int, duration: float):
         """Worker that makes requests at specified rate"""
@@ -116,24 +319,28 @@ class StressTest:
         delay = 1.0 / requests_per_second
         
         end_time = time.time() + duration
-        local_results = TestResult()
+        exemplars = self.exemplar_recorder()
+        local_results = TestResult(exemplars=exemplars)
+        local_warmup = TestResult()
+        self.warmup_results.append(local_warmup)
+        test_start = self.results.start_time
+        sequence = 0
         
-        connector = aiohttp.TCPConnector(limit=0)  # No connection limit
-        async with aiohttp.ClientSession(connector=connector) as session:
+        async with self.create_session() as session:
             while time.time() < end_time:
                 start_request = time.time()
                 
-                result = await self.make_request(session)
+                sequence += 1
+                result = await self.make_request(session, f"{self.run_id}-{worker_id}-{sequence}")
                 
                 # Update local results
-                local_results.total_requests += 1
-                if result["success"]:
-                    local_results.successful += 1
-                    local_results.latencies.append(result["latency"])
-                    status_code = result["status_code"]
-                    local_results.status_codes[status_code] = local_results.status_codes.get(status_code, 0) + 1
+                window = int(start_request - test_start)
+                if start_request >= self.measure_from:
+                    local_results.record(result, window)
                 else:
-                    local_results.failed += 1
+                    local_warmup.record(result, window)
+                    # Warm-up requests stay exemplar candidates
+                    exemplars.offer(result)
                 
                 # Calculate time to wait to maintain rate
                 request_time = time.time() - start_request
@@ -144,11 +351,52 @@ class StressTest:
         
         return local_results
     
+    async def watch_steady_state(self):
+        """Move the measurement start once windowed stats settle"""
+        detector = SteadyStateDetector(
+            windows=self.config.steady_state_windows,
+            tolerance=self.config.steady_state_tolerance,
+        )
+        test_start = self.results.start_time
+        window = 0
+        
+        while True:
+            # Requests land in their start window only when they complete, so
+            # evaluate each window one window after it closes; otherwise slow
+            # in-flight warm-up requests would be missed
+            await asyncio.sleep(max(0, test_start + window + 2 - time.time()))
+            
+            requests = failed = 0
+            latency_sum = 0.0
+            for local_warmup in self.warmup_results:
+                bucket = local_warmup.timeline.get(window)
+                if bucket is not None:
+                    requests += bucket["requests"]
+                    failed += bucket["failed"]
+                    latency_sum += bucket["latency_sum"]
+            
+            if detector.update(requests, failed, latency_sum):
+                # Everything started before now was already filed as warm-up,
+                # so measurement starts here rather than at the window boundary
+                self.measure_from = time.time()
+                return
+            window += 1
+    
     async def run(self) -> TestResult:
         """Run the stress test"""
         print(f"[cyan]Starting stress test with {self.config.processes} workers...[/cyan]")
         
         self.results.start_time = time.time()
+        self.results.exemplars = self.exemplar_recorder()
+        
+        watcher = None
+        if self.config.warmup == "auto":
+            self.measure_from = float("inf")
+            watcher = asyncio.create_task(self.watch_steady_state())
+        else:
+            self.measure_from = self.results.start_time + (self.config.warmup_seconds or 0)
+        
+        self.sampler.start()
         
         # Create tasks for each worker
         tasks = []
@@ -157,18 +405,33 @@ class StressTest:
             tasks.append(task)
         
         # Run all workers concurrently
-        worker_results = await asyncio.gather(*tasks)
+        try:
+            worker_results = await asyncio.gather(*tasks)
+        finally:
+            self.results.resource_samples = self.sampler.stop()
+            if watcher is not None:
+                watcher.cancel()
         
         # Aggregate results
         for result in worker_results:
-            self.results.total_requests += result.total_requests
-            self.results.successful += result.successful
-            self.results.failed += result.failed
-            self.results.latencies.extend(result.latencies)
-            
-            for status_code, count in result.status_codes.items():
-                self.results.status_codes[status_code] = self.results.status_codes.get(status_code, 0) + count
+            self.results.merge(result)
         
         self.results.end_time = time.time()
         
+        if self.config.warmup is not None:
+            warmup = TestResult(
+                start_time=self.results.start_time,
+                end_time=min(self.measure_from, self.results.end_time),
+            )
+            for result in self.warmup_results:
+                warmup.merge(result)
+            
+            if self.measure_from < self.results.end_time:
+                self.results.steady_state_start = self.measure_from
+                self.results.warmup = warmup
+                self.results.merge_timeline(warmup.timeline)
+            else:
+                print("[yellow]Warm-up did not end before the test finished; warm-up requests included in stats[/yellow]")
+                self.results.merge(warmup)
+        
         return self.results
\ No newline at end of file
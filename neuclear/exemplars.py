@@ -0,0 +1,120 @@
+"""
+Tail-latency exemplars: the slowest requests, kept with full detail
+"""
+
+import heapq
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+# timestamp is absolute wall-clock time, for matching against server logs
+EXEMPLAR_FIELDS = ("request_id", "timestamp", "method", "url", "status_code", "error", "latency", "phases")
+
+class ExemplarRecorder:
+    """
+    Keeps a bounded top-K heap of the slowest requests per time window,
+    plus a 1-in-N sample of all requests (reservoir-capped at
+    `max_sampled` when set).
+
+    Offering a request costs one comparison against the heap minimum;
+    the exemplar itself is only built when the request makes the cut.
+    """
+
+    def __init__(
+        self,
+        start_time: float,
+        top_k: int = 10,
+        sample_every: int = 1000,
+        window: int = 10,
+        max_sampled: Optional[int] = None,
+    ):
+        if top_k < 0 or sample_every < 0:
+            raise ValueError("top_k and sample_every cannot be negative")
+        if window <= 0:
+            raise ValueError("Exemplar window must be positive")
+
+        self.start_time = start_time
+        self.top_k = top_k
+        self.sample_every = sample_every
+        self.window = window
+        self.max_sampled = max_sampled
+        self.slowest: Dict[int, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self.sampled: List[Dict[str, Any]] = []
+        self._seen = 0
+        # Heap tie-breaker, unique within this recorder so exemplars are never compared
+        self._sequence = 0
+
+    def _push(self, heap: List[Tuple[float, int, Dict[str, Any]]], latency: float, exemplar: Dict[str, Any]):
+        """Keep the top-K slowest in a window heap"""
+        self._sequence += 1
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, (latency, self._sequence, exemplar))
+        else:
+            heapq.heapreplace(heap, (latency, self._sequence, exemplar))
+
+    def _exemplar(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        exemplar = {field: result.get(field) for field in EXEMPLAR_FIELDS}
+        exemplar["t"] = round(result["timestamp"] - self.start_time, 6)
+        return exemplar
+
+    def _add_sample(self, result: Dict[str, Any]):
+        if self.max_sampled is None or len(self.sampled) < self.max_sampled:
+            self.sampled.append(self._exemplar(result))
+            return
+        slot = random.randrange(self._seen // self.sample_every)
+        if slot < self.max_sampled:
+            self.sampled[slot] = self._exemplar(result)
+
+    def offer(self, result: Dict[str, Any]):
+        """Consider a request result for the exemplar sets"""
+        self._seen += 1
+        latency = result["latency"]
+
+        if self.sample_every and self._seen % self.sample_every == 0:
+            self._add_sample(result)
+
+        if not self.top_k:
+            return
+
+        window = int((result["timestamp"] - self.start_time) // self.window)
+        heap = self.slowest.get(window)
+        if heap is None:
+            heap = self.slowest[window] = []
+
+        if len(heap) < self.top_k or latency > heap[0][0]:
+            self._push(heap, latency, self._exemplar(result))
+
+    def merge(self, other: "ExemplarRecorder"):
+        """Merge another recorder (e.g. from a worker) into this one"""
+        for window, other_heap in other.slowest.items():
+            heap = self.slowest.setdefault(window, [])
+            # Re-key entries: sequence numbers from another recorder may collide
+            for latency, _, exemplar in other_heap:
+                if len(heap) < self.top_k or latency > heap[0][0]:
+                    self._push(heap, latency, exemplar)
+
+        self.sampled.extend(other.sampled)
+        if self.max_sampled is not None and len(self.sampled) > self.max_sampled:
+            self.sampled = random.sample(self.sampled, self.max_sampled)
+        self.sampled.sort(key=lambda exemplar: exemplar["t"])
+        self._seen += other._seen
+
+    def to_dict(self) -> dict:
+        """Convert exemplars to a report dictionary, slowest first per window"""
+        return {
+            "start_time": self.start_time,
+            "window_seconds": self.window,
+            "top_k": self.top_k,
+            "sample_every": self.sample_every,
+            "slowest": [
+                {
+                    "window": window * self.window,
+                    "requests": [
+                        exemplar for _, _, exemplar in sorted(
+                            self.slowest[window], key=lambda entry: entry[0], reverse=True
+                        )
+                    ],
+                }
+                for window in sorted(self.slowest)
+            ],
+            "sampled": sorted(self.sampled, key=lambda exemplar: exemplar["t"]),
+        }
@@ -0,0 +1,153 @@
+"""
+Background resource sampling during a stress test
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, List, Optional
+
+import psutil  # type: ignore
+
+@dataclass
+class ResourceSample:
+    """A single resource snapshot"""
+    timestamp: float
+    cpu_percent: float
+    rss_bytes: int
+    sockets: int  # Open socket fds, or all open fds where /proc is unavailable
+    net_sent_per_sec: float
+    net_recv_per_sec: float
+    target_cpu_percent: Optional[float] = None
+    target_rss_bytes: Optional[int] = None
+
+    def to_dict(self, start_time: float = 0.0) -> dict:
+        """Convert sample to dictionary, with time relative to start_time"""
+        data = asdict(self)
+        data["t"] = round(self.timestamp - start_time, 3)
+        del data["timestamp"]
+        return data
+
+FD_DIR = "/proc/self/fd"
+
+def _count_sockets(proc: psutil.Process) -> int:
+    """
+    Count sockets held by this process.
+
+    On Linux this only reads the fd links under /proc/self/fd; it avoids
+    psutil's connection APIs, which parse the system-wide /proc/net tables
+    on every call. Elsewhere the open fd count is used as a proxy.
+    """
+    if os.path.isdir(FD_DIR):
+        count = 0
+        for fd in os.listdir(FD_DIR):
+            try:
+                if os.readlink(os.path.join(FD_DIR, fd)).startswith("socket:"):
+                    count += 1
+            except OSError:  # fd closed since listing
+                continue
+        return count
+
+    try:
+        return int(proc.num_fds())
+    except (AttributeError, psutil.AccessDenied):  # num_fds is Unix-only
+        return 0
+
+class ResourceSampler:
+    """
+    Samples generator CPU, RSS, socket count and NIC throughput on a
+    background thread, optionally alongside a local target process.
+
+    All psutil calls are non-blocking, so sampling does not stall the
+    event loop driving the load.
+    """
+
+    def __init__(self, interval: float = 1.0, target_pid: Optional[int] = None):
+        if interval <= 0:
+            raise ValueError("Sample interval must be positive")
+
+        self.interval = interval
+        self.target_pid = target_pid
+        self.samples: List[ResourceSample] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._proc = psutil.Process()
+        self._target: Optional[psutil.Process] = None
+        self._last_net: Any = None  # psutil snetio, None until primed
+        self._last_time = 0.0
+
+    def _prime(self):
+        """Take baseline readings so the first sample has valid deltas"""
+        self._proc.cpu_percent(interval=None)
+        if self.target_pid is not None:
+            try:
+                self._target = psutil.Process(self.target_pid)
+                self._target.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._target = None
+        self._last_net = psutil.net_io_counters()
+        self._last_time = time.time()
+
+    def sample(self) -> ResourceSample:
+        """Take a single sample and append it to the sample list"""
+        if self._last_net is None:
+            self._prime()
+
+        now = time.time()
+        net = psutil.net_io_counters()
+        elapsed = max(now - self._last_time, 1e-9)
+
+        sample = ResourceSample(
+            timestamp=now,
+            cpu_percent=self._proc.cpu_percent(interval=None),
+            rss_bytes=self._proc.memory_info().rss,
+            sockets=_count_sockets(self._proc),
+            net_sent_per_sec=(net.bytes_sent - self._last_net.bytes_sent) / elapsed,
+            net_recv_per_sec=(net.bytes_recv - self._last_net.bytes_recv) / elapsed,
+        )
+
+        if self._target is not None:
+            try:
+                sample.target_cpu_percent = self._target.cpu_percent(interval=None)
+                sample.target_rss_bytes = self._target.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._target = None
+
+        self._last_net = net
+        self._last_time = now
+        self.samples.append(sample)
+        return sample
+
+    @property
+    def latest(self) -> Optional[ResourceSample]:
+        """Most recent sample, if any"""
+        return self.samples[-1] if self.samples else None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        """Start sampling in the background"""
+        if self._thread is not None:
+            return
+        self._prime()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[ResourceSample]:
+        """Stop sampling and return the collected samples"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        return self.samples
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
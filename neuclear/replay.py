@@ -0,0 +1,417 @@
+"""
+Access log replay with original request timing
+"""
+
+import asyncio
+import gzip
+import itertools
+import json
+import multiprocessing
+import queue
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from urllib.parse import urlsplit
+
+from .config import Config
+from .core import StressTest, TestResult
+
+# nginx/Apache combined (and common) log format
+COMBINED_PATTERN = re.compile(
+    r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] '
+    r'"(?P<method>[A-Z]+) (?P<path>\S+)[^"]*"'
+)
+COMBINED_TIME_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+
+# nginx $msec (epoch seconds with millisecond resolution) is preferred when present
+JSON_TIME_KEYS = ("msec", "timestamp", "@timestamp", "time", "time_local", "time_iso8601", "ts")
+JSON_METHOD_KEYS = ("method", "request_method")
+JSON_PATH_KEYS = ("path", "request_uri", "uri", "url")
+
+# Bounded reservoirs keep memory flat in log size; the per-second timeline
+# and per-window top-K exemplars still grow with replay duration
+MAX_SAMPLES = 100_000
+MAX_EXEMPLAR_SAMPLES = 10_000  # 1-in-N exemplars kept per worker
+BATCH_SIZE = 256  # Entries per hand-off from the reader to a worker
+QUEUE_BATCHES = 64  # Batches buffered per worker ahead of schedule
+
+Batch = List[Tuple[float, str, str]]
+WorkerOutcome = Union[Tuple[TestResult, "TimingAccuracy"], Exception]
+
+@dataclass
+class LogEntry:
+    """A single recorded request"""
+    timestamp: float
+    method: str
+    path: str
+
+_time_cache: Dict[str, float] = {}
+
+def _parse_combined_time(value: str) -> float:
+    """Parse a combined-format timestamp; consecutive lines usually repeat it"""
+    parsed = _time_cache.get(value)
+    if parsed is None:
+        if len(_time_cache) > 1024:
+            _time_cache.clear()
+        parsed = _time_cache[value] = datetime.strptime(value, COMBINED_TIME_FORMAT).timestamp()
+    return parsed
+
+def _epoch_seconds(value: float) -> float:
+    # Epoch milliseconds are common in JSON logs
+    return value / 1000 if value > 1e11 else value
+
+def _parse_json_time(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return _epoch_seconds(float(value))
+
+    value = str(value)
+    try:
+        return _epoch_seconds(float(value))
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return _parse_combined_time(value)
+
+def _first(data: dict, keys) -> Any:
+    for key in keys:
+        if data.get(key) is not None:
+            return data[key]
+    return None
+
+def _normalize_path(path: str) -> str:
+    """Strip scheme and host from absolute URLs, keeping path and query"""
+    if path.startswith(("http://", "https://")):
+        parts = urlsplit(path)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+    return path if path.startswith("/") else "/" + path
+
+def parse_log_line(line: str) -> Optional[LogEntry]:
+    """Parse a combined-format or JSON log line, or return None if unparseable"""
+    line = line.strip()
+    if not line:
+        return None
+
+    try:
+        if line.startswith("{"):
+            data = json.loads(line)
+            method = _first(data, JSON_METHOD_KEYS)
+            path = _first(data, JSON_PATH_KEYS)
+            if (method is None or path is None) and data.get("request"):
+                # nginx $request: "GET /path HTTP/1.1"
+                method, path = data["request"].split(" ")[:2]
+            timestamp = _first(data, JSON_TIME_KEYS)
+            if method is None or path is None or timestamp is None:
+                return None
+            return LogEntry(_parse_json_time(timestamp), str(method).upper(), _normalize_path(str(path)))
+
+        match = COMBINED_PATTERN.match(line)
+        if match is None:
+            return None
+        return LogEntry(
+            _parse_combined_time(match.group("time")),
+            match.group("method"),
+            _normalize_path(match.group("path")),
+        )
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+def _open_log(filename: str) -> TextIO:
+    if filename.endswith(".gz"):
+        return gzip.open(filename, "rt", encoding="utf-8", errors="replace")
+    return open(filename, "r", encoding="utf-8", errors="replace")
+
+def iter_log_entries(filename: str) -> Iterator[LogEntry]:
+    """Stream log entries without loading the file"""
+    with _open_log(filename) as f:
+        for line in f:
+            entry = parse_log_line(line)
+            if entry is not None:
+                yield entry
+
+def _spread(group: List[LogEntry]) -> Iterator[LogEntry]:
+    for index, entry in enumerate(group):
+        entry.timestamp += index / len(group)
+        yield entry
+
+def spread_within_second(entries: Iterable[LogEntry]) -> Iterator[LogEntry]:
+    """
+    Spread consecutive entries sharing a whole-second timestamp evenly
+    across that second.
+
+    Combined-format logs only record whole seconds, so replaying them as
+    logged would fire each second's traffic as one burst. Entries with
+    sub-second timestamps pass through unchanged. Only one second of
+    entries is buffered at a time.
+    """
+    group: List[LogEntry] = []
+    for entry in entries:
+        if group and entry.timestamp != group[0].timestamp:
+            yield from _spread(group)
+            group = []
+        if entry.timestamp.is_integer():
+            group.append(entry)
+        else:
+            yield entry
+    yield from _spread(group)
+
+class TimingAccuracy:
+    """Streaming lateness stats: how far each send was behind its schedule"""
+
+    def __init__(self, max_samples: int = MAX_SAMPLES):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.max_samples = max_samples
+        self.samples: List[float] = []
+
+    def add(self, lateness: float):
+        """Record one send's lateness in ms"""
+        self.count += 1
+        self.total += lateness
+        self.max = max(self.max, lateness)
+        if len(self.samples) < self.max_samples:
+            self.samples.append(lateness)
+        else:
+            slot = random.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = lateness
+
+    def merge(self, other: "TimingAccuracy"):
+        """Merge another worker's stats into this one"""
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.samples.extend(other.samples)
+        if len(self.samples) > self.max_samples:
+            self.samples = random.sample(self.samples, self.max_samples)
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.count,
+            "mean_lateness_ms": self.total / self.count if self.count else 0.0,
+            "p50_lateness_ms": self.percentile(50),
+            "p99_lateness_ms": self.percentile(99),
+            "max_lateness_ms": self.max,
+        }
+
+async def _replay_worker(
+    config: Config,
+    worker_id: int,
+    entries: "multiprocessing.Queue[Optional[Batch]]",
+    base_timestamp: float,
+    start_at: float,
+    speed: float,
+    max_in_flight: int,
+):
+    stress_test = StressTest(config)
+    stress_test.results.start_time = start_at
+    results = TestResult(
+        exemplars=stress_test.exemplar_recorder(max_sampled=MAX_EXEMPLAR_SAMPLES),
+        max_latency_samples=MAX_SAMPLES,
+    )
+    accuracy = TimingAccuracy()
+    base_url = config.target_url.rstrip("/")
+    in_flight = asyncio.Semaphore(max_in_flight)
+    loop = asyncio.get_running_loop()
+    pending = set()
+    sequence = 0
+
+    async def send(session, method: str, path: str, due: float, request_id: str):
+        try:
+            accuracy.add(max(0.0, time.time() - due) * 1000)
+            result = await stress_test.make_request(session, request_id, method, base_url + path)
+            results.record(result, int(result["timestamp"] - start_at))
+        finally:
+            in_flight.release()
+
+    async with stress_test.create_session() as session:
+        while True:
+            batch = await loop.run_in_executor(None, entries.get)
+            if batch is None:
+                break
+
+            for timestamp, method, path in batch:
+                due = start_at + (timestamp - base_timestamp) / speed
+                delay = due - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # Bound outstanding requests; if the target falls behind, lateness shows it
+                await in_flight.acquire()
+                sequence += 1
+                task = asyncio.create_task(
+                    send(session, method, path, due, f"{stress_test.run_id}-{worker_id}-{sequence}")
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+    return results, accuracy
+
+def _run_replay_worker(
+    worker_id: int,
+    results_queue: "multiprocessing.Queue[Tuple[int, WorkerOutcome]]",
+    config: Config,
+    *args,
+):
+    """Worker process entry point"""
+    try:
+        results_queue.put((worker_id, asyncio.run(_replay_worker(config, worker_id, *args))))
+    except Exception as e:
+        results_queue.put((worker_id, e))
+        raise
+
+class LogReplay:
+    """Replays a recorded access log against a target at (scaled) original timing"""
+
+    def __init__(
+        self,
+        config: Config,
+        log_file: str,
+        speed: float = 1.0,
+        max_in_flight: int = 1000,
+    ):
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+        if max_in_flight <= 0:
+            raise ValueError("Max in-flight requests must be positive")
+
+        self.config = config
+        self.log_file = log_file
+        self.speed = speed
+        self.max_in_flight = max_in_flight
+        self.results = TestResult(max_latency_samples=MAX_SAMPLES)
+        self.accuracy: List[TimingAccuracy] = []
+
+    def _put(
+        self,
+        entries: "multiprocessing.Queue[Optional[Batch]]",
+        batch: Optional[Batch],
+        worker: multiprocessing.Process,
+    ):
+        """Hand a batch to a worker, failing instead of blocking if it died"""
+        while True:
+            try:
+                entries.put(batch, timeout=1.0)
+                return
+            except queue.Full:
+                if not worker.is_alive():
+                    raise RuntimeError(f"Replay worker exited early (exit code {worker.exitcode})")
+
+    def run(self, startup_delay: float = 1.0) -> TestResult:
+        """
+        Replay the log across `config.processes` worker processes.
+
+        The log is read and parsed once, here, and entries are dealt
+        round-robin to the workers in batches through bounded queues.
+        """
+        stream = spread_within_second(iter_log_entries(self.log_file))
+        first = next(stream, None)
+        if first is None:
+            raise ValueError(f"No parseable entries in {self.log_file}")
+
+        workers = self.config.processes
+        # Common start time for all workers, leaving room for processes to spawn
+        start_at = time.time() + startup_delay
+        results_queue: "multiprocessing.Queue[Tuple[int, WorkerOutcome]]" = multiprocessing.Queue()
+        entry_queues: "List[multiprocessing.Queue[Optional[Batch]]]" = [
+            multiprocessing.Queue(maxsize=QUEUE_BATCHES) for _ in range(workers)
+        ]
+        processes = [
+            multiprocessing.Process(
+                target=_run_replay_worker,
+                args=(worker_id, results_queue, self.config, entry_queues[worker_id],
+                      first.timestamp, start_at, self.speed, self.max_in_flight),
+                daemon=True,
+            )
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        self.results.start_time = start_at
+        try:
+            batches: List[Batch] = [[] for _ in range(workers)]
+            for index, entry in enumerate(itertools.chain([first], stream)):
+                worker_id = index % workers
+                batch = batches[worker_id]
+                batch.append((entry.timestamp, entry.method, entry.path))
+                if len(batch) >= BATCH_SIZE:
+                    self._put(entry_queues[worker_id], batch, processes[worker_id])
+                    batches[worker_id] = []
+
+            for worker_id, batch in enumerate(batches):
+                if batch:
+                    self._put(entry_queues[worker_id], batch, processes[worker_id])
+                self._put(entry_queues[worker_id], None, processes[worker_id])
+
+            # Collect before joining so large results cannot block queue feeders
+            worker_results: Dict[int, WorkerOutcome] = {}
+            while len(worker_results) < workers:
+                try:
+                    worker_id, outcome = results_queue.get(timeout=1.0)
+                    worker_results[worker_id] = outcome
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        raise RuntimeError("Replay workers exited without reporting results")
+        finally:
+            for process in processes:
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    process.terminate()
+        self.results.end_time = time.time()
+
+        self.accuracy = []
+        for worker_id in range(workers):
+            outcome = worker_results[worker_id]
+            if isinstance(outcome, Exception):
+                raise outcome
+            results, accuracy = outcome
+            self.results.merge(results)
+            self.accuracy.append(accuracy)
+
+        return self.results
+
+    def timing_report(self) -> dict:
+        """Timing accuracy per worker and overall"""
+        overall = TimingAccuracy()
+        for accuracy in self.accuracy:
+            overall.merge(accuracy)
+
+        return {
+            "workers": [
+                {"worker": worker_id, **accuracy.to_dict()}
+                for worker_id, accuracy in enumerate(self.accuracy)
+            ],
+            "overall": overall.to_dict(),
+        }
+
+    def to_dict(self) -> dict:
+        """Convert replay results to a report dictionary"""
+        report = self.results.to_dict()
+        report["replay"] = {
+            "log_file": self.log_file,
+            "speed": self.speed,
+            "timing_accuracy": self.timing_report(),
+        }
+        return report
+
+    def save_report(self, filename: str):
+        """Save report to JSON file"""
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -3,17 +3,60 @@ Test runner and worker orchestration
 """
 
 import asyncio
+import itertools
+import json
 import multiprocessing
-from typing import List, Optional
+from dataclasses import replace
+from typing import List, Optional, Sequence
 from concurrent.futures import ProcessPoolExecutor
 import time
+import aiohttp
+import psutil  # type: ignore
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from rich.live import Live
 from rich.table import Table
 
 from .config import Config
 from .core import StressTest, TestResult
-from .utils import print_banner, get_system_info
+from .monitor import ResourceSampler
+from .utils import print_banner, console
+
+MATRIX_MODES = ("sequential", "isolated")
+
+def build_matrix(
+    base: Config,
+    endpoints: Sequence[str],
+    rates: Sequence[int],
+    payload_sizes: Sequence[int] = (0,),
+) -> List[Config]:
+    """Expand endpoints × rates × payload sizes into one config per test"""
+    return [
+        replace(base, target_url=url, rate=rate, payload_size=size)
+        for url, rate, size in itertools.product(endpoints, rates, payload_sizes)
+    ]
+
+def split_cpus(parallel: int) -> List[List[int]]:
+    """Partition the CPUs available to this process into disjoint sets"""
+    try:
+        cpus = sorted(psutil.Process().cpu_affinity())
+    except AttributeError:  # cpu_affinity is unsupported on macOS
+        cpus = list(range(psutil.cpu_count() or 1))
+    
+    parallel = max(1, min(parallel, len(cpus)))
+    size = len(cpus) // parallel
+    return [cpus[i * size:(i + 1) * size] for i in range(parallel)]
+
+def _pin_worker(cpu_sets: "multiprocessing.Queue[List[int]]"):
+    """Process pool initializer: pin this worker to its own CPU set"""
+    cpus = cpu_sets.get()
+    try:
+        psutil.Process().cpu_affinity(cpus)
+    except AttributeError:
+        pass
+
+def _run_isolated(config: Config) -> TestResult:
+    """Run a single test in a pool worker process"""
+    return asyncio.run(StressTest(config).run())
 
 class TestRunner:
     """Orchestrates multiple stress tests"""
@@ -36,6 +79,90 @@ class TestRunner:
         
         return asyncio.run(run_all())
     
+    def run_matrix(
+        self,
+        configs: List[Config],
+        mode: str = "sequential",
+        parallel: Optional[int] = None,
+    ) -> List[TestResult]:
+        """
+        Run a matrix of tests without them interfering with each other.
+        
+        "sequential" runs tests one after another in one event loop,
+        reusing a warm connection pool. "isolated" runs up to `parallel`
+        tests at once, each in its own process pinned to a disjoint CPU set.
+        """
+        if mode not in MATRIX_MODES:
+            raise ValueError(f"Mode must be one of: {', '.join(MATRIX_MODES)}")
+        
+        if mode == "sequential":
+            async def run_all():
+                results = []
+                connector = aiohttp.TCPConnector(limit=0)
+                try:
+                    for config in configs:
+                        results.append(await StressTest(config, connector=connector).run())
+                finally:
+                    await connector.close()
+                return results
+            
+            self.results = asyncio.run(run_all())
+            return self.results
+        
+        cpu_sets = split_cpus(parallel or len(configs))
+        queue: "multiprocessing.Queue[List[int]]" = multiprocessing.Queue()
+        for cpus in cpu_sets:
+            queue.put(cpus)
+        
+        with ProcessPoolExecutor(
+            max_workers=len(cpu_sets),
+            initializer=_pin_worker,
+            initargs=(queue,),
+        ) as executor:
+            self.results = list(executor.map(_run_isolated, configs))
+        
+        return self.results
+    
+    def comparison_report(self, configs: List[Config], results: List[TestResult]) -> dict:
+        """Build one consolidated report comparing matrix results"""
+        return {
+            "tests": [
+                {"config": config.to_dict(), "results": result.to_dict()}
+                for config, result in zip(configs, results)
+            ],
+        }
+    
+    def save_comparison_report(self, configs: List[Config], results: List[TestResult], filename: str):
+        """Save the consolidated comparison report to JSON file"""
+        with open(filename, 'w') as f:
+            json.dump(self.comparison_report(configs, results), f, indent=2)
+    
+    def print_comparison(self, configs: List[Config], results: List[TestResult]):
+        """Print a comparison table of matrix results"""
+        table = Table(title="Test Matrix Comparison", header_style="bold cyan")
+        table.add_column("Target", overflow="fold")
+        table.add_column("Rate/proc")
+        table.add_column("Payload")
+        table.add_column("Requests")
+        table.add_column("Success")
+        table.add_column("Avg (ms)")
+        table.add_column("p99 (ms)")
+        table.add_column("RPS")
+        
+        for config, result in zip(configs, results):
+            table.add_row(
+                config.target_url,
+                str(config.rate),
+                f"{config.payload_size}B",
+                str(result.total_requests),
+                f"{result.success_rate:.1f}%",
+                f"{result.avg_latency:.2f}",
+                f"{result.p99_latency:.2f}",
+                f"{result.rps:.1f}",
+            )
+        
+        console.print(table)
+    
     def run_with_progress(self) -> TestResult:
         """Run test with progress bar"""
         print_banner()
@@ -52,7 +179,7 @@ class TestRunner:
                 total=self.config.duration_seconds
             )
             
-            async def run_with_update():
+            async def run_with_update() -> TestResult:
                 stress_test = StressTest(self.config)
                 start_time = time.time()
                 
@@ -78,19 +205,27 @@ class TestRunner:
         table.add_column("Metric")
         table.add_column("Value")
         
-        with Live(table, refresh_per_second=4) as live:
+        sampler = ResourceSampler(interval=interval, target_pid=self.config.target_pid)
+        
+        with Live(table, refresh_per_second=4) as live, sampler:
             try:
                 while True:
-                    info = get_system_info()
+                    time.sleep(interval)
+                    sample = sampler.latest
+                    if sample is None:
+                        continue
                     
                     table.rows = []
-                    table.add_row("CPU Count", str(info["cpu_count"]))
-                    table.add_row("CPU Usage", f"{info['cpu_percent']:.1f}%")
-                    table.add_row("Memory Available", f"{info['memory_available'] / 1e9:.2f} GB")
-                    table.add_row("Network Connections", str(info["network_connections"]))
+                    table.add_row("CPU Usage", f"{sample.cpu_percent:.1f}%")
+                    table.add_row("RSS", f"{sample.rss_bytes / 1e6:.1f} MB")
+                    table.add_row("Sockets", str(sample.sockets))
+                    table.add_row("Net Sent", f"{sample.net_sent_per_sec / 1e6:.2f} MB/s")
+                    table.add_row("Net Received", f"{sample.net_recv_per_sec / 1e6:.2f} MB/s")
+                    if sample.target_rss_bytes is not None:
+                        table.add_row("Target CPU", f"{sample.target_cpu_percent:.1f}%")
+                        table.add_row("Target RSS", f"{sample.target_rss_bytes / 1e6:.1f} MB")
                     
                     live.update(table)
-                    time.sleep(interval)
             except KeyboardInterrupt:
                 pass
 
@@ -60,13 +60,21 @@ def parse_duration(duration_str: str) -> float:
     return value * multipliers[unit]
 
 def get_system_info() -> dict:
-    """Get system information for monitoring"""
+    """
+    Get system information for monitoring, without blocking.
+    
+    cpu_percent is measured since the previous call (0.0 on the first), and
+    network_connections counts this process's sockets only.
+    """
+    from .monitor import _count_sockets
+    
+    memory = psutil.virtual_memory()
     return {
         "cpu_count": psutil.cpu_count(),
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "memory_total": psutil.virtual_memory().total,
-        "memory_available": psutil.virtual_memory().available,
-        "network_connections": len(psutil.net_connections()),
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory_total": memory.total,
+        "memory_available": memory.available,
+        "network_connections": _count_sockets(psutil.Process()),
     }
 
 def is_port_open(host: str, port: int, timeout: float = 2.0) -> bool:
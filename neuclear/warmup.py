@@ -0,0 +1,48 @@
+"""
+Steady-state detection for warm-up exclusion
+"""
+
+import statistics
+from collections import deque
+from typing import Deque, Tuple
+
+class SteadyStateDetector:
+    """
+    Decides when a test has reached steady state from per-window aggregates.
+
+    Steady state is reached once throughput and mean latency over the last
+    `windows` windows both have a coefficient of variation within
+    `tolerance`. Each update is O(windows), so it is cheap to run live.
+    """
+
+    def __init__(self, windows: int = 5, tolerance: float = 0.2):
+        if windows < 2:
+            raise ValueError("Steady state detection needs at least 2 windows")
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+
+        self.windows = windows
+        self.tolerance = tolerance
+        self.history: Deque[Tuple[float, float]] = deque(maxlen=windows)
+
+    @staticmethod
+    def _variation(values) -> float:
+        mean = statistics.mean(values)
+        if mean <= 0:
+            return float("inf")
+        return float(statistics.pstdev(values) / mean)
+
+    def update(self, requests: int, failed: int, latency_sum: float) -> bool:
+        """Add a closed window's aggregates; return True once steady"""
+        succeeded = requests - failed
+        mean_latency = latency_sum / succeeded if succeeded else 0.0
+        self.history.append((float(requests), mean_latency))
+
+        if len(self.history) < self.windows:
+            return False
+
+        throughputs, latencies = zip(*self.history)
+        return (
+            self._variation(throughputs) <= self.tolerance
+            and self._variation(latencies) <= self.tolerance
+        )
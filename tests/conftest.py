@@ -0,0 +1,46 @@
+"""Shared test fixtures"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from aiohttp import web
+
+@pytest.fixture
+def local_server():
+    """
+    Serve on a background event loop.
+    
+    Yields an object with `url` and `requests`, a list of
+    (arrival time, method, path, client peer) tuples.
+    """
+    server = SimpleNamespace(url=None, requests=[], delay=0.0)
+    
+    async def handler(request):
+        server.requests.append((
+            time.time(),
+            request.method,
+            request.path_qs,
+            request.transport.get_extra_info("peername"),
+        ))
+        if server.delay:
+            await asyncio.sleep(server.delay)
+        return web.Response(text="ok")
+    
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", handler)
+    app_runner = web.AppRunner(app)
+    loop.run_until_complete(app_runner.setup())
+    loop.run_until_complete(web.TCPSite(app_runner, "127.0.0.1", 0).start())
+    server.url = f"http://127.0.0.1:{app_runner.addresses[0][1]}"
+    
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(app_runner.cleanup())
+    loop.close()
@@ -29,4 +29,14 @@ def test_duration_conversion():
     assert config.duration_seconds == 60
     
     config = Config(target_url="http://example.com", duration="2h")
-    assert config.duration_seconds == 7200
\ No newline at end of file
+    assert config.duration_seconds == 7200
+
+
+def test_warmup():
+    """Test warm-up configuration"""
+    assert Config(target_url="http://example.com").warmup_seconds is None
+    assert Config(target_url="http://example.com", warmup="auto").warmup_seconds is None
+    assert Config(target_url="http://example.com", warmup="1m").warmup_seconds == 60
+    
+    with pytest.raises(ValueError):
+        Config(target_url="http://example.com", warmup="soon")
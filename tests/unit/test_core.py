@@ -0,0 +1,65 @@
+"""Unit tests for result aggregation"""
+
+from neuclear import core
+
+def _result(success=True, latency=10.0, status_code=200):
+    return {
+        "success": success,
+        "status_code": status_code if success else 0,
+        "latency": latency,
+        "error": None,
+    }
+
+def test_record_updates_timeline():
+    """Test recording requests into per-second windows"""
+    result = core.TestResult()
+    result.record(_result(latency=10.0), 0)
+    result.record(_result(latency=30.0), 0)
+    result.record(_result(success=False), 1)
+    
+    assert result.total_requests == 3
+    assert result.successful == 2
+    assert result.failed == 1
+    assert result.status_codes == {200: 2}
+    
+    timeline = result.timeline_report()
+    assert timeline[0] == {"t": 0, "requests": 2, "failed": 0, "avg_latency": 20.0}
+    assert timeline[1] == {"t": 1, "requests": 1, "failed": 1, "avg_latency": 0.0}
+
+def test_merge():
+    """Test merging worker results"""
+    first = core.TestResult()
+    first.record(_result(latency=10.0), 0)
+    second = core.TestResult()
+    second.record(_result(latency=20.0), 0)
+    second.record(_result(latency=40.0, status_code=500), 2)
+    
+    first.merge(second)
+    
+    assert first.total_requests == 3
+    assert first.status_codes == {200: 2, 500: 1}
+    assert first.timeline[0]["requests"] == 2
+    assert first.timeline[2]["latency_sum"] == 40.0
+
+def test_report_separates_warmup():
+    """Test warm-up stats are reported apart from steady-state stats"""
+    result = core.TestResult(start_time=100.0, end_time=110.0, steady_state_start=104.0)
+    result.record(_result(latency=10.0), 5)
+    result.warmup = core.TestResult(start_time=100.0, end_time=104.0)
+    result.warmup.record(_result(latency=90.0), 1)
+    
+    report = result.to_dict()
+    
+    assert report["steady_state_start"] == 4.0
+    assert report["duration_seconds"] == 6.0
+    assert report["avg_latency"] == 10.0
+    assert report["warmup"]["avg_latency"] == 90.0
+    assert report["warmup"]["duration_seconds"] == 4.0
+
+def test_percentiles_single_sample():
+    """Test percentiles with a single successful request"""
+    result = core.TestResult()
+    result.record(_result(latency=12.5), 0)
+    
+    assert result.p95_latency == 12.5
+    assert result.p99_latency == 12.5
@@ -0,0 +1,97 @@
+"""Unit tests for tail-latency exemplars"""
+
+import copy
+import pytest
+from neuclear.exemplars import ExemplarRecorder
+
+def _result(latency, timestamp, request_id="req"):
+    return {
+        "timestamp": timestamp,
+        "request_id": request_id,
+        "method": "GET",
+        "url": "http://example.com",
+        "status_code": 200,
+        "error": None,
+        "latency": latency,
+        "phases": {"ttfb": latency},
+    }
+
+def test_keeps_slowest_per_window():
+    """Test the heap keeps only the top-K slowest requests per window"""
+    recorder = ExemplarRecorder(start_time=100.0, top_k=2, sample_every=0, window=10)
+    for i, latency in enumerate([5, 50, 1, 30, 40]):
+        recorder.offer(_result(latency, 100.0 + i, f"a-{i}"))
+    recorder.offer(_result(7, 115.0, "b-0"))
+    
+    report = recorder.to_dict()
+    assert [w["window"] for w in report["slowest"]] == [0, 10]
+    assert [e["latency"] for e in report["slowest"][0]["requests"]] == [50, 40]
+    assert report["slowest"][0]["requests"][0]["request_id"] == "a-1"
+    assert report["slowest"][0]["requests"][0]["t"] == 1.0
+    assert report["slowest"][0]["requests"][0]["timestamp"] == 101.0
+    assert report["start_time"] == 100.0
+    assert report["sampled"] == []
+
+def test_samples_one_in_n():
+    """Test 1-in-N sampling"""
+    recorder = ExemplarRecorder(start_time=0.0, top_k=0, sample_every=3)
+    for i in range(10):
+        recorder.offer(_result(1, float(i), f"r-{i}"))
+    
+    assert [e["request_id"] for e in recorder.sampled] == ["r-2", "r-5", "r-8"]
+    assert recorder.slowest == {}
+
+def test_sampled_reservoir_is_capped():
+    """Test max_sampled bounds the 1-in-N sample, including across merges"""
+    first = ExemplarRecorder(start_time=0.0, top_k=0, sample_every=2, max_sampled=5)
+    second = ExemplarRecorder(start_time=0.0, top_k=0, sample_every=2, max_sampled=5)
+    for i in range(1000):
+        first.offer(_result(1, float(i), f"a-{i}"))
+        second.offer(_result(1, float(i), f"b-{i}"))
+    
+    assert len(first.sampled) == 5
+    assert len({e["request_id"] for e in first.sampled}) == 5
+    # Reservoir replacement draws from the whole run, not just the start
+    assert max(e["t"] for e in first.sampled) > 10
+    
+    first.merge(second)
+    
+    report = first.to_dict()
+    assert len(report["sampled"]) == 5
+    assert [e["t"] for e in report["sampled"]] == sorted(e["t"] for e in report["sampled"])
+
+def test_merge():
+    """Test merging worker recorders keeps the global top-K"""
+    first = ExemplarRecorder(start_time=0.0, top_k=2, sample_every=2)
+    second = ExemplarRecorder(start_time=0.0, top_k=2, sample_every=2)
+    for latency in (10, 20, 30):
+        first.offer(_result(latency, 1.0))
+    for latency in (25, 35, 5):
+        second.offer(_result(latency, 2.0))
+    
+    first.merge(second)
+    
+    report = first.to_dict()
+    assert [e["latency"] for e in report["slowest"][0]["requests"]] == [35, 30]
+    assert [e["t"] for e in report["sampled"]] == [1.0, 2.0]
+
+def test_merge_colliding_sequences():
+    """Test merging a copied recorder (as from forked workers) never compares exemplars"""
+    first = ExemplarRecorder(start_time=0.0, top_k=3, sample_every=0)
+    first.offer(_result(10, 1.0, "a"))
+    first.offer(_result(10, 1.5, "b"))
+    # Same latencies and heap sequence numbers, different exemplars
+    second = copy.deepcopy(first)
+    for heap in second.slowest.values():
+        for _, _, exemplar in heap:
+            exemplar["request_id"] += "-copy"
+    
+    first.merge(second)
+    
+    requests = first.to_dict()["slowest"][0]["requests"]
+    assert [e["latency"] for e in requests] == [10, 10, 10]
+
+def test_invalid_window():
+    """Test invalid window handling"""
+    with pytest.raises(ValueError):
+        ExemplarRecorder(start_time=0.0, window=0)
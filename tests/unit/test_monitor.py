@@ -0,0 +1,55 @@
+"""Unit tests for resource sampling"""
+
+import os
+import socket
+import psutil
+import pytest
+from neuclear.monitor import ResourceSampler, _count_sockets
+
+def test_sample_fields():
+    """Test a single synchronous sample"""
+    sampler = ResourceSampler(interval=0.1)
+    sample = sampler.sample()
+    
+    assert sample.rss_bytes > 0
+    assert sample.sockets >= 0
+    assert sample.net_sent_per_sec >= 0
+    assert sample.target_rss_bytes is None
+    assert sampler.latest is sample
+
+def test_target_pid_sampling():
+    """Test sampling a target process alongside the generator"""
+    sampler = ResourceSampler(interval=0.1, target_pid=os.getpid())
+    sample = sampler.sample()
+    
+    assert sample.target_rss_bytes > 0
+    assert sample.target_cpu_percent is not None
+
+def test_background_sampling():
+    """Test samples are collected on a background thread"""
+    with ResourceSampler(interval=0.05) as sampler:
+        import time
+        time.sleep(0.3)
+    
+    assert len(sampler.samples) >= 2
+    timestamps = [sample.timestamp for sample in sampler.samples]
+    assert timestamps == sorted(timestamps)
+    
+    data = sampler.samples[0].to_dict(start_time=timestamps[0])
+    assert data["t"] == 0
+    assert "timestamp" not in data
+
+def test_invalid_interval():
+    """Test invalid interval handling"""
+    with pytest.raises(ValueError):
+        ResourceSampler(interval=0)
+
+def test_socket_count_tracks_open_sockets():
+    """Test the socket count sees sockets opened by this process"""
+    before = _count_sockets(psutil.Process())
+    sockets = [socket.socket() for _ in range(3)]
+    try:
+        assert _count_sockets(psutil.Process()) >= before + 3
+    finally:
+        for sock in sockets:
+            sock.close()
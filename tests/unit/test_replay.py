@@ -0,0 +1,111 @@
+"""Unit tests for access log replay"""
+
+import json
+import pytest
+from neuclear.config import Config
+from neuclear.replay import LogEntry, LogReplay, TimingAccuracy, parse_log_line, spread_within_second
+
+COMBINED_LINE = (
+    '127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] '
+    '"GET /apache_pb.gif?x=1 HTTP/1.0" 200 2326 "http://example.com/" "Mozilla/4.08"'
+)
+
+def test_parse_combined():
+    """Test combined log format parsing"""
+    entry = parse_log_line(COMBINED_LINE)
+    
+    assert entry.method == "GET"
+    assert entry.path == "/apache_pb.gif?x=1"
+    assert entry.timestamp == 971211336.0
+
+def test_parse_jsonl():
+    """Test JSON log line parsing"""
+    entry = parse_log_line(json.dumps({
+        "time": "2000-10-10T20:55:36.250Z",
+        "method": "post",
+        "url": "https://example.com/api?id=3",
+    }))
+    assert entry.method == "POST"
+    assert entry.path == "/api?id=3"
+    assert entry.timestamp == 971211336.25
+    
+    entry = parse_log_line(json.dumps({"ts": 971211336000, "request": "DELETE /x HTTP/1.1"}))
+    assert entry.method == "DELETE"
+    assert entry.path == "/x"
+    assert entry.timestamp == 971211336.0
+
+@pytest.mark.parametrize("line", ["", "garbage", "{not json", json.dumps({"path": "/x"})])
+def test_parse_invalid(line):
+    """Test unparseable lines are skipped"""
+    assert parse_log_line(line) is None
+
+def test_parse_jsonl_msec():
+    """Test nginx $msec is preferred for sub-second timing"""
+    entry = parse_log_line(json.dumps({
+        "msec": "971211336.125",
+        "time_local": "10/Oct/2000:13:55:36 -0700",
+        "request": "GET / HTTP/1.1",
+    }))
+    assert entry.timestamp == 971211336.125
+    
+    entry = parse_log_line(json.dumps({"ts": "971211336250", "request": "GET / HTTP/1.1"}))
+    assert entry.timestamp == 971211336.25
+
+def test_spread_within_second():
+    """Test whole-second entries are spread evenly across their second"""
+    entries = [
+        LogEntry(100.0, "GET", "/a"),
+        LogEntry(100.0, "GET", "/b"),
+        LogEntry(100.0, "GET", "/c"),
+        LogEntry(100.0, "GET", "/d"),
+        LogEntry(101.0, "GET", "/e"),
+        LogEntry(101.5, "GET", "/f"),
+        LogEntry(102.0, "GET", "/g"),
+        LogEntry(102.0, "GET", "/h"),
+    ]
+    
+    spread = [(e.path, e.timestamp) for e in spread_within_second(iter(entries))]
+    
+    assert spread == [
+        ("/a", 100.0), ("/b", 100.25), ("/c", 100.5), ("/d", 100.75),
+        ("/e", 101.0), ("/f", 101.5),
+        ("/g", 102.0), ("/h", 102.5),
+    ]
+
+def test_replay_scales_send_offsets(tmp_path, local_server):
+    """Test replayed requests keep their recorded offsets, scaled by speed"""
+    log_offsets = [0.0, 1.0, 2.0, 4.0, 6.0]
+    log_file = tmp_path / "access.jsonl"
+    log_file.write_text("\n".join(
+        json.dumps({"msec": 1700000000.5 + offset, "request": f"GET /r/{i} HTTP/1.1"})
+        for i, offset in enumerate(log_offsets)
+    ))
+    config = Config(target_url=local_server.url, processes=2)
+    
+    replay = LogReplay(config, str(log_file), speed=10)
+    result = replay.run(startup_delay=0.5)
+    
+    assert result.total_requests == len(log_offsets)
+    arrivals = {path: arrived for arrived, _, path, _ in local_server.requests}
+    first = arrivals["/r/0"]
+    for i, offset in enumerate(log_offsets):
+        assert arrivals[f"/r/{i}"] - first == pytest.approx(offset / 10, abs=0.05)
+    
+    timing = replay.timing_report()
+    assert [w["requests"] for w in timing["workers"]] == [3, 2]
+    assert timing["overall"]["requests"] == len(log_offsets)
+
+def test_timing_accuracy():
+    """Test lateness stats and merging"""
+    first = TimingAccuracy(max_samples=10)
+    second = TimingAccuracy(max_samples=10)
+    for lateness in range(10):
+        first.add(float(lateness))
+    second.add(100.0)
+    
+    first.merge(second)
+    report = first.to_dict()
+    
+    assert report["requests"] == 11
+    assert report["max_lateness_ms"] == 100.0
+    assert len(first.samples) == 10
@@ -0,0 +1,76 @@
+"""Unit tests for the test matrix runner"""
+
+import queue
+import psutil
+import pytest
+from neuclear.config import Config
+from neuclear import runner
+from neuclear.runner import _pin_worker, build_matrix, split_cpus
+
+def test_build_matrix():
+    """Test matrix expansion of endpoints × rates × payload sizes"""
+    base = Config(target_url="http://example.com", processes=2, duration="10s")
+    configs = build_matrix(
+        base,
+        ["http://example.com/a", "http://example.com/b"],
+        [100, 200],
+        [0, 1024],
+    )
+    
+    assert len(configs) == 8
+    assert {c.target_url for c in configs} == {"http://example.com/a", "http://example.com/b"}
+    assert {c.rate for c in configs} == {100, 200}
+    assert {c.payload_size for c in configs} == {0, 1024}
+    assert all(c.processes == 2 and c.duration == "10s" for c in configs)
+
+def test_build_matrix_validates():
+    """Test invalid matrix entries are rejected"""
+    base = Config(target_url="http://example.com")
+    with pytest.raises(ValueError):
+        build_matrix(base, ["example.com"], [100])
+
+def test_split_cpus_disjoint():
+    """Test CPU sets do not overlap"""
+    cpu_sets = split_cpus(64)
+    
+    assert cpu_sets
+    assert all(cpu_sets)
+    flat = [cpu for cpus in cpu_sets for cpu in cpus]
+    assert len(flat) == len(set(flat))
+
+def test_invalid_matrix_mode():
+    """Test unknown scheduler modes are rejected"""
+    test_runner = runner.TestRunner(Config(target_url="http://example.com"))
+    with pytest.raises(ValueError):
+        test_runner.run_matrix([], mode="parallel")
+
+def test_sequential_matrix_reuses_connections(local_server):
+    """Test sequential mode runs every test on one warm connection pool"""
+    url = local_server.url
+    base = Config(target_url=url, processes=1, duration="1s", sample_interval=0.5)
+    configs = build_matrix(base, [url + "/a", url + "/b"], [20])
+    
+    results = runner.TestRunner(base).run_matrix(configs, mode="sequential")
+    
+    assert len(results) == 2
+    assert all(r.total_requests > 0 and r.failed == 0 for r in results)
+    # One worker at a time on a shared connector: the first connection is reused
+    assert len({peer for _, _, _, peer in local_server.requests}) == 1
+
+@pytest.mark.skipif(
+    not hasattr(psutil.Process(), "cpu_affinity"),
+    reason="CPU affinity is not supported on this platform",
+)
+def test_pin_worker_sets_affinity():
+    """Test pool workers are pinned to the CPU set they take from the queue"""
+    process = psutil.Process()
+    original = process.cpu_affinity()
+    assigned = split_cpus(len(original))[-1]
+    cpu_sets = queue.Queue()
+    cpu_sets.put(assigned)
+    
+    try:
+        _pin_worker(cpu_sets)
+        assert process.cpu_affinity() == assigned
+    finally:
+        process.cpu_affinity(original)
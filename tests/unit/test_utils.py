@@ -1,7 +1,8 @@
 """Unit tests for utility functions"""
 
+import time
 import pytest
-from neuclear.utils import validate_url, format_duration, parse_duration
+from neuclear.utils import validate_url, format_duration, parse_duration, get_system_info
 
 def test_validate_url():
     """Test URL validation"""
@@ -24,4 +25,11 @@ def test_parse_duration():
     assert parse_duration("2h") == 7200
     
     with pytest.raises(ValueError):
-        parse_duration("30")
\ No newline at end of file
+        parse_duration("30")
+def test_get_system_info_does_not_block():
+    """Test system info is returned without a sampling sleep"""
+    started = time.time()
+    info = get_system_info()
+    
+    assert time.time() - started < 0.5
+    assert info["network_connections"] >= 0
@@ -0,0 +1,110 @@
+"""Unit tests for steady-state detection"""
+
+import asyncio
+import threading
+import time
+import pytest
+from neuclear.config import Config
+from neuclear import core
+from neuclear.core import StressTest
+from neuclear.warmup import SteadyStateDetector
+
+def test_detects_steady_state():
+    """Test detection after throughput and latency settle"""
+    detector = SteadyStateDetector(windows=3, tolerance=0.1)
+    warming = [(20, 0, 20 * 80.0), (60, 0, 60 * 40.0), (100, 0, 100 * 15.0)]
+    steady = [(100, 0, 100 * 10.0), (98, 0, 98 * 10.5), (101, 0, 101 * 9.8)]
+    
+    assert not any(detector.update(*window) for window in warming)
+    assert [detector.update(*window) for window in steady] == [False, False, True]
+
+def test_unstable_latency_is_not_steady():
+    """Test steady throughput alone is not enough"""
+    detector = SteadyStateDetector(windows=3, tolerance=0.1)
+    results = [detector.update(100, 0, 100 * latency) for latency in (10.0, 30.0, 10.0, 30.0)]
+    assert not any(results)
+
+def test_empty_windows_are_not_steady():
+    """Test idle or all-failed windows never count as steady"""
+    detector = SteadyStateDetector(windows=2)
+    assert not detector.update(0, 0, 0.0)
+    assert not detector.update(0, 0, 0.0)
+    assert not detector.update(50, 50, 0.0)
+
+def test_invalid_windows():
+    """Test invalid window count handling"""
+    with pytest.raises(ValueError):
+        SteadyStateDetector(windows=1)
+
+def _run(config):
+    return asyncio.run(StressTest(config).run())
+
+def test_fixed_warmup_is_reported_separately(local_server):
+    """Test requests before the fixed warm-up end are kept out of the stats"""
+    config = Config(target_url=local_server.url, processes=1, rate=20, duration="3s", warmup="1s")
+    
+    result = _run(config)
+    report = result.to_dict()
+    
+    assert report["steady_state_start"] == pytest.approx(1.0)
+    assert result.warmup.total_requests == pytest.approx(20, abs=3)
+    assert result.total_requests == pytest.approx(40, abs=4)
+    assert sum(w["requests"] for w in report["timeline"]) == (
+        result.total_requests + result.warmup.total_requests
+    )
+    assert len(local_server.requests) == result.total_requests + result.warmup.total_requests
+
+def test_auto_warmup_waits_for_steady_latency(local_server):
+    """Test slow start-up requests are detected as warm-up"""
+    local_server.delay = 0.2
+    threading.Timer(1.0, setattr, (local_server, "delay", 0.0)).start()
+    config = Config(
+        target_url=local_server.url,
+        processes=2,
+        rate=20,
+        duration="7s",
+        warmup="auto",
+        steady_state_windows=2,
+        steady_state_tolerance=0.5,
+    )
+    
+    result = _run(config)
+    
+    # Windows 1 and 2 are the first settled pair at the earliest, and
+    # window 2 is evaluated once window 3 has closed
+    assert 4.0 <= result.steady_state_start - result.start_time <= 5.5
+    assert result.warmup.p99_latency >= 150
+    assert result.p99_latency < 50
+    
+    # No steady requests are filed as warm-up at the boundary
+    assert result.rps == pytest.approx(config.rate * config.processes, rel=0.15)
+    arrived = sum(1 for arrival, *_ in local_server.requests if arrival < result.steady_state_start)
+    assert abs(result.warmup.total_requests - arrived) <= config.processes
+
+async def test_watcher_sees_requests_completing_after_window_closes():
+    """Test a slow request finishing after its window closed still counts"""
+    config = Config(
+        target_url="http://example.com",
+        warmup="auto",
+        steady_state_windows=2,
+        steady_state_tolerance=0.1,
+    )
+    stress_test = StressTest(config)
+    stress_test.results.start_time = time.time()
+    local = core.TestResult()
+    stress_test.warmup_results.append(local)
+    ok = {"success": True, "status_code": 200, "latency": 10.0}
+    for window in (0, 1):
+        for _ in range(10):
+            local.record(ok, window)
+    
+    watcher = asyncio.create_task(stress_test.watch_steady_state())
+    try:
+        # A cold request started in window 0 completes after the window closed
+        await asyncio.sleep(1.5)
+        local.record({**ok, "latency": 900.0}, 0)
+        # Windows 0 and 1 have now been evaluated
+        await asyncio.sleep(1.6)
+        assert not watcher.done()
+    finally:
+        watcher.cancel()